@@ -8,60 +8,98 @@ import sys
 import json
 from pathlib import Path
 
-# Add the current directory to Python path
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+# Prefer orjson for parsing when it is installed; its errors subclass json.JSONDecodeError
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _flush(lines):
+    """Write the buffered lines to stdout in a single call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
 
 def debug_environment():
     """Debug the current environment."""
-    print("🔍 Environment Debug Information")
-    print("=" * 50)
-    print(f"Python executable: {sys.executable}")
-    print(f"Current working directory: {os.getcwd()}")
-    print(f"Script directory: {current_dir}")
-    print(f"Python path: {sys.path[:3]}...")
+    lines = [
+        "🔍 Environment Debug Information",
+        "=" * 50,
+        f"Python executable: {sys.executable}",
+        f"Current working directory: {Path.cwd()}",
+        f"Script directory: {_SCRIPT_DIR}",
+        f"Python path: {sys.path[:3]}...",
+    ]
     
-    # Check for credential files
-    creds_file = current_dir / "credentials.json"
-    token_file = current_dir / "token.json"
+    # Check for credential files with a single directory listing
+    with os.scandir(_SCRIPT_DIR) as it:
+        entries = {entry.name: entry for entry in it}
     
-    print(f"\n📁 File Check:")
-    print(f"credentials.json exists: {creds_file.exists()}")
-    print(f"token.json exists: {token_file.exists()}")
+    lines.append("\n📁 File Check:")
+    lines.append(f"credentials.json exists: {'credentials.json' in entries}")
+    lines.append(f"token.json exists: {'token.json' in entries}")
     
-    if token_file.exists():
+    if 'token.json' in entries:
         try:
-            with open(token_file, 'r') as f:
-                token_data = json.load(f)
-                print(f"Token keys: {list(token_data.keys())}")
+            with open(entries['token.json'].path, 'rb') as f:
+                token_data = _json_loads(f.read())
+        except (OSError, ValueError) as e:
+            # ValueError covers JSON and UTF-8 decode errors from either parser
+            lines.append(f"Error reading token: {e}")
+        else:
+            if not isinstance(token_data, dict):
+                lines.append(f"Error reading token: expected a JSON object, got {type(token_data).__name__}")
+            else:
+                lines.append(f"Token keys: {list(token_data.keys())}")
                 if 'expiry' in token_data:
-                    print(f"Token expires: {token_data['expiry']}")
-        except Exception as e:
-            print(f"Error reading token: {e}")
+                    lines.append(f"Token expires: {token_data['expiry']}")
     
     # Test imports
-    print(f"\n📦 Import Test:")
+    lines.append("\n📦 Import Test:")
+    # Flush before the slow import and auth steps so progress stays visible
+    _flush(lines)
     try:
-        from server import get_google_tasks_service
-        print("✅ Successfully imported get_google_tasks_service")
+        from server import get_google_tasks_service, _invalidate_service
+        from googleapiclient.errors import HttpError
+        lines.append("✅ Successfully imported get_google_tasks_service")
         
         # Test authentication
-        print(f"\n🔐 Authentication Test:")
+        lines.append("\n🔐 Authentication Test:")
+        _flush(lines)
+        # server caches the service, so repeated calls reuse it
         service = get_google_tasks_service()
         if service:
-            print("✅ Google Tasks service created successfully")
+            lines.append("✅ Google Tasks service created successfully")
             try:
-                tasklists = service.tasklists().list().execute()
-                print(f"✅ API call successful, found {len(tasklists.get('items', []))} task lists")
+                # Only the ids are needed to count the lists
+                tasklists = service.tasklists().list(fields="items(id)", maxResults=100).execute()
+                lines.append(f"✅ API call successful, found {len(tasklists.get('items', []))} task lists")
+            except HttpError as e:
+                if e.resp.status == 401:
+                    _invalidate_service()
+                lines.append(f"❌ API call failed: {e}")
             except Exception as e:
-                print(f"❌ API call failed: {e}")
+                lines.append(f"❌ API call failed: {e}")
         else:
-            print("❌ Failed to create Google Tasks service")
+            lines.append("❌ Failed to create Google Tasks service")
             
     except Exception as e:
-        print(f"❌ Import failed: {e}")
+        lines.append(f"❌ Import failed: {e}")
+        _flush(lines)
         import traceback
-        traceback.print_exc()
+        if os.environ.get('GOOGLE_TASKS_DEBUG') == '1':
+            traceback.print_exc()
+        else:
+            # Innermost frames only - enough to locate the failing import
+            traceback.print_exception(type(e), e, e.__traceback__, limit=-3, chain=False)
+    
+    _flush(lines)
 
 if __name__ == "__main__":
     debug_environment()
@@ -6,25 +6,40 @@ This script should be used in the Gemini CLI configuration instead of main.py.
 
 import os
 import sys
-from pathlib import Path
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Ensure we're in the correct directory
-script_dir = Path(__file__).parent
-os.chdir(script_dir)
+os.chdir(_SCRIPT_DIR)
 
-# Add the current directory to Python path
-sys.path.insert(0, str(script_dir))
+# Always cache bytecode so later launches skip recompiling server and its
+# dependencies, even if the client launches us with PYTHONDONTWRITEBYTECODE set
+sys.dont_write_bytecode = False
 
-# Set environment variables to help with debugging
-os.environ['GOOGLE_TASKS_DEBUG'] = '1'
+# Set environment variables to help with debugging (set GOOGLE_TASKS_DEBUG=0 to disable)
+os.environ.setdefault('GOOGLE_TASKS_DEBUG', '1')
 
 # Import and run the server
 if __name__ == "__main__":
+    # Fail fast on a missing setup before paying for the Google client imports
+    if not (
+        os.getenv('GOOGLE_TASKS_TOKEN')
+        or os.path.exists(os.path.join(_SCRIPT_DIR, "token.json"))
+        or os.path.exists(os.path.join(_SCRIPT_DIR, "credentials.json"))
+    ):
+        print(
+            f"No credentials found: set GOOGLE_TASKS_TOKEN or place credentials.json in {_SCRIPT_DIR}",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+
     try:
         from server import main
         main()
     except Exception as e:
         print(f"Error starting server: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc(file=sys.stderr)
+        # Only pay for the traceback import when debugging is enabled
+        if os.environ.get('GOOGLE_TASKS_DEBUG') == '1':
+            import traceback
+            traceback.print_exc(file=sys.stderr)
         sys.exit(1)
@@ -5,17 +5,33 @@ Google Tasks MCP Server
 A Model Context Protocol server that provides access to Google Tasks API.
 """
 
+import asyncio
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
+import google_auth_httplib2
 from fastmcp import FastMCP, Context
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
+from googleapiclient.model import JsonModel
+
+# orjson is optional; when installed it decodes tokens and API responses
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,51 +46,200 @@ import os
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CREDENTIALS_FILE = os.path.join(SCRIPT_DIR, 'credentials.json')
 TOKEN_FILE = os.path.join(SCRIPT_DIR, 'token.json')
+DISCOVERY_FILE = os.path.join(SCRIPT_DIR, 'tasks_discovery_v1.json')
+DISCOVERY_URL = 'https://tasks.googleapis.com/$discovery/rest?version=v1'
+
+# Token from the GOOGLE_TASKS_TOKEN environment variable (for deployment),
+# parsed once at import since it cannot change while the server runs
+_BOOT_TOKEN_INFO: Optional[Dict[str, Any]] = None
+_token_env = os.getenv('GOOGLE_TASKS_TOKEN')
+if _token_env:
+    try:
+        _BOOT_TOKEN_INFO = _json_loads(_token_env)
+    except ValueError as e:
+        logger.error("Failed to parse GOOGLE_TASKS_TOKEN: %s", e)
 
 # Initialize the FastMCP server
 mcp = FastMCP("google-tasks-mcp-server")
 
+# Parsed Tasks API discovery document, loaded once per process
+_DISCOVERY_DOC: Optional[Dict[str, Any]] = None
 
-def get_google_tasks_service():
-    """Get authenticated Google Tasks service."""
+
+def _fetch_discovery_doc() -> str:
+    """Download the discovery document and save it to DISCOVERY_FILE for next time."""
+    logger.info("Fetching discovery document from %s", DISCOVERY_URL)
+    resp, content = build_http().request(DISCOVERY_URL)
+    if resp.status >= 400:
+        raise HttpError(resp, content, uri=DISCOVERY_URL)
+    doc = content.decode('utf-8')
+    # Write via a temporary file so a crash or concurrent start never leaves
+    # a truncated copy behind
+    try:
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=SCRIPT_DIR, suffix='.tmp', delete=False) as f:
+            f.write(doc)
+        os.replace(f.name, DISCOVERY_FILE)
+    except OSError as e:
+        logger.warning("Failed to cache discovery document: %s", e)
+    return doc
+
+
+def _get_discovery_doc() -> Dict[str, Any]:
+    """Load and parse the Tasks v1 discovery document once per process.
+
+    Prefers the copy bundled with googleapiclient, then a copy saved in
+    DISCOVERY_FILE, and only downloads it when neither is available.
+    """
+    global _DISCOVERY_DOC
+    if _DISCOVERY_DOC is None:
+        doc = get_static_doc('tasks', 'v1')
+        if doc is not None:
+            _DISCOVERY_DOC = _json_loads(doc)
+        else:
+            try:
+                with open(DISCOVERY_FILE, 'rb') as f:
+                    _DISCOVERY_DOC = _json_loads(f.read())
+            except FileNotFoundError:
+                _DISCOVERY_DOC = _json_loads(_fetch_discovery_doc())
+            except ValueError as e:
+                # A damaged copy would otherwise break every later start
+                logger.warning("Discarding unreadable discovery document %s: %s", DISCOVERY_FILE, e)
+                try:
+                    os.remove(DISCOVERY_FILE)
+                except OSError:
+                    pass
+                _DISCOVERY_DOC = _json_loads(_fetch_discovery_doc())
+    return _DISCOVERY_DOC
+
+
+# Authenticated service reused across tool calls, together with its credentials
+_SERVICE: Optional[Any] = None
+_CREDS: Optional[Credentials] = None
+_SERVICE_LOCK = threading.Lock()
+
+# Background task refreshing the token _REFRESH_MARGIN seconds before it expires.
+# google-auth treats credentials as invalid REFRESH_THRESHOLD (~225 s) before
+# expiry and then refreshes synchronously on the request path, so the margin
+# must stay clear of that window.
+_REFRESH_TASK: Optional[asyncio.Task] = None
+_REFRESH_MARGIN = 300.0
+# Shortest pause between background refreshes, so tokens that live no longer
+# than the margin (or a skewed clock) cannot make the loop spin
+_REFRESH_MIN_INTERVAL = 30.0
+
+
+def _save_token(creds: Credentials) -> None:
+    """Persist credentials to TOKEN_FILE for the next run.
+
+    The token is written to a temporary file and renamed into place, so a
+    concurrent reader never sees a partially written file.
+    """
+    try:
+        with tempfile.NamedTemporaryFile('w', dir=SCRIPT_DIR, suffix='.tmp', delete=False) as token:
+            token.write(creds.to_json())
+        os.replace(token.name, TOKEN_FILE)
+    except Exception as e:
+        logger.error("Failed to save token: %s", e)
+
+
+# Idle authorized Http objects. httplib2.Http is not thread-safe, so each request
+# borrows one for its duration; returning it keeps its TLS connections open for reuse.
+_HTTP_POOL: List[google_auth_httplib2.AuthorizedHttp] = []
+_HTTP_POOL_LOCK = threading.Lock()
+_HTTP_POOL_SIZE = 10
+
+# Retries (with exponential backoff) for rate limits, 5xx responses and connection
+# errors. POST requests (insert/move) are not retried, as a retry could apply twice.
+_NUM_RETRIES = 3
+
+
+def _borrow_http(creds: Credentials) -> google_auth_httplib2.AuthorizedHttp:
+    """Take an idle Http authorized with `creds` from the pool, or create one."""
+    with _HTTP_POOL_LOCK:
+        while _HTTP_POOL:
+            http = _HTTP_POOL.pop()
+            # Entries for replaced credentials are simply dropped
+            if http.credentials is creds:
+                return http
+    # build_http() applies googleapiclient's socket timeout, so a stalled
+    # connection cannot hold a worker thread forever
+    return google_auth_httplib2.AuthorizedHttp(creds, http=build_http())
+
+
+def _return_http(http: google_auth_httplib2.AuthorizedHttp) -> None:
+    """Give a borrowed Http back to the pool."""
+    with _HTTP_POOL_LOCK:
+        if len(_HTTP_POOL) < _HTTP_POOL_SIZE:
+            _HTTP_POOL.append(http)
+
+
+class _FastJsonModel(JsonModel):
+    """JsonModel that decodes response bodies with orjson when it is installed."""
+
+    def deserialize(self, content):
+        try:
+            body = _json_loads(content)
+        except ValueError:
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+class _PooledHttpRequest(HttpRequest):
+    """HttpRequest that executes on a pooled Http and retries transient failures."""
+
+    def execute(self, http=None, num_retries=None):
+        if num_retries is None:
+            num_retries = 0 if self.method == 'POST' else _NUM_RETRIES
+        if http is not None:
+            return super().execute(http=http, num_retries=num_retries)
+        pooled = _borrow_http(self.http.credentials)
+        try:
+            return super().execute(http=pooled, num_retries=num_retries)
+        finally:
+            _return_http(pooled)
+
+
+def _build_service():
+    """Load credentials and build a new Google Tasks service.
+
+    Returns a (service, creds) tuple, or (None, None) on failure.
+    """
     creds = None
     
-    logger.info(f"Looking for credentials at: {CREDENTIALS_FILE}")
-    logger.info(f"Looking for token at: {TOKEN_FILE}")
-    logger.info(f"Current working directory: {os.getcwd()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Looking for credentials at: %s", CREDENTIALS_FILE)
+        logger.debug("Looking for token at: %s", TOKEN_FILE)
+        logger.debug("Current working directory: %s", os.getcwd())
     
     # Try loading token from environment variable first (for deployment)
-    token_env = os.getenv('GOOGLE_TASKS_TOKEN')
-    if token_env:
+    if _BOOT_TOKEN_INFO:
         try:
             logger.info("Loading token from GOOGLE_TASKS_TOKEN environment variable...")
-            import json
-            token_info = json.loads(token_env)
-            creds = Credentials.from_authorized_user_info(token_info, SCOPES)
+            creds = Credentials.from_authorized_user_info(_BOOT_TOKEN_INFO, SCOPES)
         except Exception as e:
-            logger.error(f"Failed to load token from environment: {e}")
+            logger.error("Failed to load token from environment: %s", e)
             creds = None
     
-    # Fallback to loading from file
-    if not creds and os.path.exists(TOKEN_FILE):
-        logger.info("Token file found, loading credentials...")
-        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
-    elif not creds:
-        logger.warning(f"Token not found in environment or at: {TOKEN_FILE}")
+    # Fallback to loading from file (open directly; a missing file raises)
+    if not creds:
+        try:
+            creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+            logger.info("Token file found, loaded credentials")
+        except FileNotFoundError:
+            logger.warning("Token not found in environment or at: %s", TOKEN_FILE)
     
     # If there are no (valid) credentials available, let the user log in
     if not creds or not creds.valid:
+        old_token = creds.token if creds else None
         if creds and creds.expired and creds.refresh_token:
             try:
                 creds.refresh(Request())
             except Exception as e:
-                logger.error(f"Failed to refresh credentials: {e}")
-                return None
+                logger.error("Failed to refresh credentials: %s", e)
+                return None, None
         else:
-            if not os.path.exists(CREDENTIALS_FILE):
-                logger.error(f"Credentials file '{CREDENTIALS_FILE}' not found. Please download it from Google Cloud Console.")
-                return None
-            
             try:
                 flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_FILE, SCOPES)
                 # Check if we're running in an interactive environment
@@ -85,25 +250,179 @@ def get_google_tasks_service():
                     # Non-interactive mode (like MCP) - use local server with port 0
                     # This will still work but may require manual URL copying
                     creds = flow.run_local_server(port=0)
+            except FileNotFoundError:
+                logger.error("Credentials file '%s' not found. Please download it from Google Cloud Console.", CREDENTIALS_FILE)
+                return None, None
             except Exception as e:
-                logger.error(f"Authentication failed: {e}")
+                logger.error("Authentication failed: %s", e)
                 logger.error("Please run the server interactively first to complete authentication:")
                 logger.error("python3 main.py")
-                return None
+                return None, None
         
-        # Save the credentials for the next run
-        try:
-            with open(TOKEN_FILE, 'w') as token:
-                token.write(creds.to_json())
-        except Exception as e:
-            logger.error(f"Failed to save token: {e}")
+        # Save the credentials for the next run, unless nothing changed
+        if creds.token != old_token:
+            _save_token(creds)
     
     try:
-        service = build('tasks', 'v1', credentials=creds)
-        return service
+        service = build_from_document(
+            _get_discovery_doc(),
+            credentials=creds,
+            model=_FastJsonModel(),
+            requestBuilder=_PooledHttpRequest,
+        )
+        return service, creds
     except Exception as e:
-        logger.error(f"Error building Google Tasks service: {e}")
-        return None
+        logger.error("Error building Google Tasks service: %s", e)
+        return None, None
+
+
+def _refresh_credentials(creds: Credentials) -> None:
+    """Refresh credentials in place, saving the token if it changed.
+
+    Callers must hold _SERVICE_LOCK. The cached service's authorized http
+    holds this same credentials object, so it picks up the new token.
+    """
+    old_token = creds.token
+    creds.refresh(Request())
+    if creds.token != old_token:
+        _save_token(creds)
+
+
+def get_google_tasks_service():
+    """Get authenticated Google Tasks service.
+
+    The service is built once and reused; expired credentials are refreshed
+    in place, and the service is only rebuilt when that is not possible.
+    """
+    global _SERVICE, _CREDS
+    with _SERVICE_LOCK:
+        if _SERVICE is not None and _CREDS is not None:
+            if _CREDS.valid:
+                return _SERVICE
+            if _CREDS.expired and _CREDS.refresh_token:
+                try:
+                    _refresh_credentials(_CREDS)
+                    return _SERVICE
+                except Exception as e:
+                    logger.error("Failed to refresh credentials: %s", e)
+        _SERVICE, _CREDS = _build_service()
+        return _SERVICE
+
+
+def _invalidate_service() -> None:
+    """Drop the cached service so the next call rebuilds it."""
+    global _SERVICE, _CREDS
+    with _SERVICE_LOCK:
+        _SERVICE = None
+        _CREDS = None
+
+
+def _seconds_until_expiry(creds: Credentials) -> float:
+    """Return the seconds left before `creds` expire (expiry must be set)."""
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (creds.expiry - now).total_seconds()
+
+
+def _refresh_cached_credentials(creds: Credentials) -> bool:
+    """Refresh `creds` if they still back the cached service; return success."""
+    with _SERVICE_LOCK:
+        if creds is not _CREDS:
+            # The service was rebuilt; the next tool call schedules a new refresh
+            return False
+        if creds.expiry is not None and _seconds_until_expiry(creds) > _REFRESH_MARGIN:
+            # Already refreshed elsewhere; _refresh_later sleeps until the new expiry
+            return True
+        try:
+            _refresh_credentials(creds)
+            return True
+        except Exception as e:
+            logger.error("Background token refresh failed: %s", e)
+            return False
+
+
+async def _refresh_later() -> None:
+    """Keep the cached credentials fresh by refreshing shortly before each expiry."""
+    while True:
+        creds = _CREDS
+        if creds is None or creds.expiry is None or not creds.refresh_token:
+            return
+        await asyncio.sleep(max(_REFRESH_MIN_INTERVAL, _seconds_until_expiry(creds) - _REFRESH_MARGIN))
+        if not await asyncio.to_thread(_refresh_cached_credentials, creds):
+            return
+
+
+def _schedule_token_refresh() -> None:
+    """Start the background token refresh unless it is already running."""
+    global _REFRESH_TASK
+    if _REFRESH_TASK is None or _REFRESH_TASK.done():
+        _REFRESH_TASK = asyncio.get_running_loop().create_task(_refresh_later())
+
+
+async def _get_service():
+    """Get the Google Tasks service without blocking the event loop."""
+    service = await asyncio.to_thread(get_google_tasks_service)
+    if service is not None:
+        _schedule_token_refresh()
+    return service
+
+
+async def _run(request):
+    """Execute an API request on a worker thread so the event loop stays free."""
+    return await asyncio.to_thread(request.execute)
+
+
+def _err(msg: str, **extra: Any) -> dict:
+    """Log an error message and return it as a tool error response."""
+    logger.error("%s", msg)
+    return {"error": msg, **extra}
+
+
+def _handle_http_error(e: HttpError, tasklist_id: Optional[str] = None) -> str:
+    """Drop any cache an API error invalidates and return the error message."""
+    if e.resp.status == 401:
+        _invalidate_service()
+    elif e.resp.status == 404 and tasklist_id is not None:
+        # Explicit ids are not validated up front, so an unknown list surfaces
+        # here; use the cached ids (if any) to tell a missing list from a missing task
+        available_lists = _get_cached_tasklist_ids()
+        if available_lists is not None and tasklist_id in available_lists:
+            return f"Task not found in task list '{tasklist_id}'."
+        _invalidate_tasklist_cache()
+        if available_lists is not None:
+            return f"Task list '{tasklist_id}' not found. Available lists: {available_lists}"
+        return f"Task list '{tasklist_id}' or task not found."
+    return f"Google Tasks API error: {str(e)}"
+
+
+# Fields returned for each task by get_tasks, with their defaults
+_TASK_FIELDS = (
+    ("id", None),
+    ("title", ""),
+    ("status", "needsAction"),
+    ("notes", ""),
+    ("due", None),
+    ("updated", None),
+    ("position", None),
+    ("parent", None),
+    ("links", ()),
+)
+
+# Fields returned for each task list by list_tasklists: (output key, API key, default)
+_TASKLIST_FIELDS = (
+    ("id", "id", None),
+    ("title", "title", ""),
+    ("updated", "updated", None),
+    ("self_link", "selfLink", None),
+)
+
+# Partial-response masks so the API only sends the keys that are formatted
+_TASKS_LIST_MASK = "items(%s)" % ",".join(k for k, _ in _TASK_FIELDS)
+_TASKLISTS_LIST_MASK = "items(%s)" % ",".join(src for _, src, _ in _TASKLIST_FIELDS)
+# search_tasks returns raw tasks, so it keeps the status detail fields too
+_SEARCH_MASK = "items(%s,completed,deleted,hidden,webViewLink),nextPageToken" % ",".join(
+    k for k, _ in _TASK_FIELDS
+)
 
 
 @mcp.tool
@@ -128,42 +447,22 @@ async def get_tasks(
         Dictionary containing the tasks data
     """
     try:
-        logger.info(f"Getting tasks from list: {tasklist_id}")
+        logger.info("Getting tasks from list: %s", tasklist_id)
         
         # Get authenticated Google Tasks service
-        service = get_google_tasks_service()
+        service = await _get_service()
         if not service:
-            return {
-                "error": "Failed to authenticate with Google Tasks API. Please check your credentials.",
-                "tasklist_id": tasklist_id,
-                "tasks": []
-            }
-        
-        # Get task lists first to validate tasklist_id
-        tasklists = service.tasklists().list().execute()
-        available_lists = [tl['id'] for tl in tasklists.get('items', [])]
-        
-        # If tasklist_id is "@default", use the first available list
-        if tasklist_id == "@default":
-            if not available_lists:
-                return {
-                    "error": "No task lists found in your Google Tasks account.",
-                    "tasklist_id": tasklist_id,
-                    "tasks": []
-                }
-            tasklist_id = available_lists[0]
-        elif tasklist_id not in available_lists:
-            return {
-                "error": f"Task list '{tasklist_id}' not found. Available lists: {available_lists}",
-                "tasklist_id": tasklist_id,
-                "available_lists": available_lists,
-                "tasks": []
-            }
+            return _err(
+                "Failed to authenticate with Google Tasks API. Please check your credentials.",
+                tasklist_id=tasklist_id,
+                tasks=[],
+            )
         
         # Build query parameters
         query_params = {
             'tasklist': tasklist_id,
-            'maxResults': max_results
+            'maxResults': max_results,
+            'fields': _TASKS_LIST_MASK
         }
         
         # Add completion filter
@@ -178,25 +477,46 @@ async def get_tasks(
         else:
             query_params['showDeleted'] = True
         
+        # Get task lists first to validate tasklist_id
+        results = None
+        available_lists = _get_cached_tasklist_ids()
+        if tasklist_id != "@default" and (available_lists is None or tasklist_id not in available_lists):
+            # Validation needs a fresh list fetch (the cache may predate a newly
+            # created list); fetch the tasks concurrently and drop them if invalid
+            _invalidate_tasklist_cache()
+            available_lists, results = await asyncio.gather(
+                _get_tasklist_ids(service),
+                _run(service.tasks().list(**query_params)),
+                return_exceptions=True,
+            )
+            if isinstance(available_lists, BaseException):
+                raise available_lists
+        elif available_lists is None:
+            available_lists = await _get_tasklist_ids(service)
+        
+        # If tasklist_id is "@default", use the first available list
+        if tasklist_id == "@default":
+            if not available_lists:
+                return _err("No task lists found in your Google Tasks account.", tasklist_id=tasklist_id, tasks=[])
+            tasklist_id = available_lists[0]
+            query_params['tasklist'] = tasklist_id
+        elif tasklist_id not in available_lists:
+            return _err(
+                f"Task list '{tasklist_id}' not found. Available lists: {available_lists}",
+                tasklist_id=tasklist_id,
+                available_lists=available_lists,
+                tasks=[],
+            )
+        
         # Get tasks from Google Tasks API
-        results = service.tasks().list(**query_params).execute()
+        if results is None:
+            results = await _run(service.tasks().list(**query_params))
+        elif isinstance(results, BaseException):
+            raise results
         tasks = results.get('items', [])
         
         # Format tasks data
-        formatted_tasks = []
-        for task in tasks:
-            formatted_task = {
-                "id": task.get('id'),
-                "title": task.get('title', ''),
-                "status": task.get('status', 'needsAction'),
-                "notes": task.get('notes', ''),
-                "due": task.get('due'),
-                "updated": task.get('updated'),
-                "position": task.get('position'),
-                "parent": task.get('parent'),
-                "links": task.get('links', [])
-            }
-            formatted_tasks.append(formatted_task)
+        formatted_tasks = [{k: task.get(k, d) for k, d in _TASK_FIELDS} for task in tasks]
         
         return {
             "tasklist_id": tasklist_id,
@@ -209,19 +529,9 @@ async def get_tasks(
         }
         
     except HttpError as e:
-        logger.error(f"Google Tasks API error: {e}")
-        return {
-            "error": f"Google Tasks API error: {str(e)}",
-            "tasklist_id": tasklist_id,
-            "tasks": []
-        }
+        return _err(_handle_http_error(e, tasklist_id), tasklist_id=tasklist_id, tasks=[])
     except Exception as e:
-        logger.error(f"Error getting tasks: {e}")
-        return {
-            "error": f"Error retrieving tasks: {str(e)}",
-            "tasklist_id": tasklist_id,
-            "tasks": []
-        }
+        return _err(f"Error retrieving tasks: {e}", tasklist_id=tasklist_id, tasks=[])
 
 
 @mcp.tool
@@ -244,27 +554,21 @@ async def list_tasklists(ctx: Context) -> dict:
         logger.info("Getting available task lists")
         
         # Get authenticated Google Tasks service
-        service = get_google_tasks_service()
+        service = await _get_service()
         if not service:
-            return {
-                "error": "Failed to authenticate with Google Tasks API. Please check your credentials.",
-                "tasklists": []
-            }
+            return _err(
+                "Failed to authenticate with Google Tasks API. Please check your credentials.",
+                tasklists=[],
+            )
         
         # Get task lists from Google Tasks API
-        results = service.tasklists().list().execute()
+        results = await _run(service.tasklists().list(fields=_TASKLISTS_LIST_MASK))
         tasklists = results.get('items', [])
         
         # Format task lists data
-        formatted_lists = []
-        for tasklist in tasklists:
-            formatted_list = {
-                "id": tasklist.get('id'),
-                "title": tasklist.get('title', ''),
-                "updated": tasklist.get('updated'),
-                "self_link": tasklist.get('selfLink')
-            }
-            formatted_lists.append(formatted_list)
+        formatted_lists = [
+            {key: tasklist.get(src, d) for key, src, d in _TASKLIST_FIELDS} for tasklist in tasklists
+        ]
         
         return {
             "total_lists": len(formatted_lists),
@@ -272,36 +576,100 @@ async def list_tasklists(ctx: Context) -> dict:
         }
         
     except HttpError as e:
-        logger.error(f"Google Tasks API error: {e}")
-        return {
-            "error": f"Google Tasks API error: {str(e)}",
-            "tasklists": []
-        }
+        return _err(_handle_http_error(e), tasklists=[])
     except Exception as e:
-        logger.error(f"Error getting task lists: {e}")
-        return {
-            "error": f"Error retrieving task lists: {str(e)}",
-            "tasklists": []
-        }
+        return _err(f"Error retrieving task lists: {e}", tasklists=[])
+
+
+# Largest page the Tasks API returns from tasks().list()
+_MAX_PAGE_SIZE = 100
+
+# Task list ids as (fetched_at, ids), reused for _TASKLIST_TTL seconds
+_TASKLIST_CACHE: Optional[Tuple[float, List[str]]] = None
+_TASKLIST_TTL = 60.0
+
+
+def _get_cached_tasklist_ids() -> Optional[List[str]]:
+    """Return the cached task list ids, or None if missing or expired."""
+    if _TASKLIST_CACHE is not None and time.monotonic() - _TASKLIST_CACHE[0] < _TASKLIST_TTL:
+        return _TASKLIST_CACHE[1]
+    return None
+
+
+async def _get_tasklist_ids(service) -> List[str]:
+    """Return the ids of all task lists, served from a short-lived cache."""
+    global _TASKLIST_CACHE
+    ids = _get_cached_tasklist_ids()
+    if ids is not None:
+        return ids
+    tasklists = await _run(service.tasklists().list(fields="items(id)"))
+    ids = [tl['id'] for tl in tasklists.get('items', [])]
+    _TASKLIST_CACHE = (time.monotonic(), ids)
+    return ids
+
 
+def _invalidate_tasklist_cache() -> None:
+    """Forget the cached task list ids."""
+    global _TASKLIST_CACHE
+    _TASKLIST_CACHE = None
 
-def _resolve_tasklist_id(service, tasklist_id: str) -> dict:
+
+async def _resolve_tasklist_id(service, tasklist_id: str) -> dict:
     """Resolve '@default' to a real tasklist id and return metadata.
 
-    Returns a dict: { 'tasklist_id': str, 'available_lists': [ids...] }
+    Explicit ids are returned as-is without an API call; an unknown id is
+    reported by the subsequent request as a 404.
+
+    Returns a dict: { 'tasklist_id': str, 'available_lists': [ids...] }, or an
+    error response if the account has no task lists.
     """
-    tasklists = service.tasklists().list().execute()
-    available_lists = [tl['id'] for tl in tasklists.get('items', [])]
-    if tasklist_id == "@default":
-        if not available_lists:
-            return {"error": "No task lists found.", "available_lists": []}
-        return {"tasklist_id": available_lists[0], "available_lists": available_lists}
-    if tasklist_id not in available_lists:
-        return {
-            "error": f"Task list '{tasklist_id}' not found.",
-            "available_lists": available_lists,
-        }
-    return {"tasklist_id": tasklist_id, "available_lists": available_lists}
+    if tasklist_id != "@default":
+        return {"tasklist_id": tasklist_id, "available_lists": []}
+    available_lists = await _get_tasklist_ids(service)
+    if not available_lists:
+        return _err("No task lists found.", available_lists=[])
+    return {"tasklist_id": available_lists[0], "available_lists": available_lists}
+
+
+async def _execute_batch(service, requests: Dict[str, Any]) -> Dict[str, Any]:
+    """Send several API requests in a single batch HTTP call.
+
+    Returns the responses keyed like `requests`. If any request failed, the
+    first error is raised after the whole batch has run.
+    """
+    responses: Dict[str, Any] = {}
+    errors: List[Exception] = []
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            errors.append(exception)
+        else:
+            responses[request_id] = response
+
+    batch = service.new_batch_http_request(callback=_collect)
+    for request_id, request in requests.items():
+        batch.add(request, request_id=request_id)
+    # The service's own AuthorizedHttp carries the credentials for the pool
+    http = _borrow_http(service._http.credentials)
+    try:
+        await asyncio.to_thread(batch.execute, http=http)
+    finally:
+        _return_http(http)
+    if errors:
+        raise errors[0]
+    return responses
+
+
+def _to_rfc3339(value: str) -> str:
+    """Normalise a date or RFC 3339 timestamp to the UTC form the Tasks API expects.
+
+    Plain dates (YYYY-MM-DD) are taken as midnight UTC. Raises ValueError on
+    anything fromisoformat cannot parse.
+    """
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
 
 
 @mcp.tool
@@ -334,15 +702,13 @@ async def create_task(
     Returns:
         Dictionary with 'tasklist_id' and 'task' (the created task object)
     """
-    from datetime import datetime
-    
     try:
-        service = get_google_tasks_service()
+        service = await _get_service()
         if not service:
-            return {"error": "Auth failed"}
-        resolved = _resolve_tasklist_id(service, tasklist_id)
+            return _err("Auth failed")
+        resolved = await _resolve_tasklist_id(service, tasklist_id)
         if "error" in resolved:
-            return {"error": resolved["error"], **resolved}
+            return resolved
         tasklist_id = resolved["tasklist_id"]
 
         # Format due date to RFC 3339 format
@@ -351,11 +717,17 @@ async def create_task(
             if 'T' in due:
                 due_formatted = due
             else:
-                # Parse YYYY-MM-DD and convert to RFC 3339 format
-                date_obj = datetime.strptime(due, "%Y-%m-%d")
-                due_formatted = date_obj.strftime("%Y-%m-%dT00:00:00.000Z")
+                # Parse YYYY-MM-DD and convert to RFC 3339 format. Check the shape
+                # first, since int() would accept signs, spaces and underscores;
+                # date() then validates the ranges
+                parts = due.split('-')
+                if (len(parts) != 3 or len(parts[0]) != 4
+                        or not all(1 <= len(p) <= 2 for p in parts[1:])
+                        or not all(p.isascii() and p.isdigit() for p in parts)):
+                    raise ValueError(f"expected YYYY-MM-DD, got {due!r}")
+                due_formatted = date(*map(int, parts)).isoformat() + "T00:00:00.000Z"
         except ValueError as e:
-            return {"error": f"Invalid date format. Please use YYYY-MM-DD format (e.g., '2024-12-31'). Error: {str(e)}"}
+            return _err(f"Invalid date format. Please use YYYY-MM-DD format (e.g., '2024-12-31'). Error: {str(e)}")
 
         body: Dict[str, Any] = {"title": title, "due": due_formatted}
         if notes is not None:
@@ -367,14 +739,12 @@ async def create_task(
         if position is not None:
             insert_kwargs["previous"] = position
 
-        created = service.tasks().insert(**insert_kwargs).execute()
+        created = await _run(service.tasks().insert(**insert_kwargs))
         return {"tasklist_id": tasklist_id, "task": created}
     except HttpError as e:
-        logger.error(f"Google Tasks API error: {e}")
-        return {"error": f"Google Tasks API error: {str(e)}"}
+        return _err(_handle_http_error(e, tasklist_id))
     except Exception as e:
-        logger.error(f"Error creating task: {e}")
-        return {"error": str(e)}
+        return _err(f"Error creating task: {e}")
 
 
 @mcp.tool
@@ -410,16 +780,14 @@ async def update_task(
         Dictionary with 'tasklist_id' and 'task' (the updated task object)
     """
     try:
-        service = get_google_tasks_service()
+        service = await _get_service()
         if not service:
-            return {"error": "Auth failed"}
-        resolved = _resolve_tasklist_id(service, tasklist_id)
+            return _err("Auth failed")
+        resolved = await _resolve_tasklist_id(service, tasklist_id)
         if "error" in resolved:
-            return {"error": resolved["error"], **resolved}
+            return resolved
         tasklist_id = resolved["tasklist_id"]
 
-        # Fetch current task
-        current = service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
         body: Dict[str, Any] = {}
         if title is not None:
             body["title"] = title
@@ -430,25 +798,35 @@ async def update_task(
         if status is not None:
             body["status"] = status
 
-        # PATCH to avoid overwriting unspecified fields
-        updated = service.tasks().patch(tasklist=tasklist_id, task=task_id, body=body).execute()
-
         # Reparent/reposition if requested
+        move_kwargs: Optional[Dict[str, Any]] = None
         if parent is not None or position is not None:
-            move_kwargs: Dict[str, Any] = {"tasklist": tasklist_id, "task": task_id}
+            move_kwargs = {"tasklist": tasklist_id, "task": task_id}
             if parent is not None:
                 move_kwargs["parent"] = parent
             if position is not None:
                 move_kwargs["previous"] = position
-            updated = service.tasks().move(**move_kwargs).execute()
+
+        if body and move_kwargs:
+            # Send the PATCH and the move in one batch round trip. Batched calls
+            # may run in either order (or concurrently), so neither response is
+            # guaranteed to reflect both changes; read the final state back.
+            await _execute_batch(service, {
+                "patch": service.tasks().patch(tasklist=tasklist_id, task=task_id, body=body),
+                "move": service.tasks().move(**move_kwargs),
+            })
+            updated = await _run(service.tasks().get(tasklist=tasklist_id, task=task_id))
+        elif move_kwargs:
+            updated = await _run(service.tasks().move(**move_kwargs))
+        else:
+            # PATCH to avoid overwriting unspecified fields
+            updated = await _run(service.tasks().patch(tasklist=tasklist_id, task=task_id, body=body))
 
         return {"tasklist_id": tasklist_id, "task": updated}
     except HttpError as e:
-        logger.error(f"Google Tasks API error: {e}")
-        return {"error": f"Google Tasks API error: {str(e)}"}
+        return _err(_handle_http_error(e, tasklist_id))
     except Exception as e:
-        logger.error(f"Error updating task: {e}")
-        return {"error": str(e)}
+        return _err(f"Error updating task: {e}")
 
 
 @mcp.tool
@@ -475,25 +853,23 @@ async def complete_task(
         Dictionary with 'tasklist_id' and 'task' (the updated task object)
     """
     try:
-        service = get_google_tasks_service()
+        service = await _get_service()
         if not service:
-            return {"error": "Auth failed"}
-        resolved = _resolve_tasklist_id(service, tasklist_id)
+            return _err("Auth failed")
+        resolved = await _resolve_tasklist_id(service, tasklist_id)
         if "error" in resolved:
-            return {"error": resolved["error"], **resolved}
+            return resolved
         tasklist_id = resolved["tasklist_id"]
 
         status = "completed" if completed else "needsAction"
-        updated = service.tasks().patch(
+        updated = await _run(service.tasks().patch(
             tasklist=tasklist_id, task=task_id, body={"status": status}
-        ).execute()
+        ))
         return {"tasklist_id": tasklist_id, "task": updated}
     except HttpError as e:
-        logger.error(f"Google Tasks API error: {e}")
-        return {"error": f"Google Tasks API error: {str(e)}"}
+        return _err(_handle_http_error(e, tasklist_id))
     except Exception as e:
-        logger.error(f"Error completing task: {e}")
-        return {"error": str(e)}
+        return _err(f"Error completing task: {e}")
 
 
 @mcp.tool
@@ -518,22 +894,20 @@ async def delete_task(
         Dictionary with 'tasklist_id', 'deleted' (True), and 'task_id'
     """
     try:
-        service = get_google_tasks_service()
+        service = await _get_service()
         if not service:
-            return {"error": "Auth failed"}
-        resolved = _resolve_tasklist_id(service, tasklist_id)
+            return _err("Auth failed")
+        resolved = await _resolve_tasklist_id(service, tasklist_id)
         if "error" in resolved:
-            return {"error": resolved["error"], **resolved}
+            return resolved
         tasklist_id = resolved["tasklist_id"]
 
-        service.tasks().delete(tasklist=tasklist_id, task=task_id).execute()
+        await _run(service.tasks().delete(tasklist=tasklist_id, task=task_id))
         return {"tasklist_id": tasklist_id, "deleted": True, "task_id": task_id}
     except HttpError as e:
-        logger.error(f"Google Tasks API error: {e}")
-        return {"error": f"Google Tasks API error: {str(e)}"}
+        return _err(_handle_http_error(e, tasklist_id))
     except Exception as e:
-        logger.error(f"Error deleting task: {e}")
-        return {"error": str(e)}
+        return _err(f"Error deleting task: {e}")
 
 
 @mcp.tool
@@ -553,17 +927,16 @@ async def create_tasklist(ctx: Context, title: str) -> dict:
         Dictionary with 'tasklist' (the created tasklist object including its id)
     """
     try:
-        service = get_google_tasks_service()
+        service = await _get_service()
         if not service:
-            return {"error": "Auth failed"}
-        created = service.tasklists().insert(body={"title": title}).execute()
+            return _err("Auth failed")
+        created = await _run(service.tasklists().insert(body={"title": title}))
+        _invalidate_tasklist_cache()
         return {"tasklist": created}
     except HttpError as e:
-        logger.error(f"Google Tasks API error: {e}")
-        return {"error": f"Google Tasks API error: {str(e)}"}
+        return _err(_handle_http_error(e))
     except Exception as e:
-        logger.error(f"Error creating task list: {e}")
-        return {"error": str(e)}
+        return _err(f"Error creating task list: {e}")
 
 
 @mcp.tool
@@ -587,21 +960,19 @@ async def get_task(
         Dictionary with 'tasklist_id' and 'task' (the complete task object)
     """
     try:
-        service = get_google_tasks_service()
+        service = await _get_service()
         if not service:
-            return {"error": "Auth failed"}
-        resolved = _resolve_tasklist_id(service, tasklist_id)
+            return _err("Auth failed")
+        resolved = await _resolve_tasklist_id(service, tasklist_id)
         if "error" in resolved:
-            return {"error": resolved["error"], **resolved}
+            return resolved
         tasklist_id = resolved["tasklist_id"]
-        task = service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
+        task = await _run(service.tasks().get(tasklist=tasklist_id, task=task_id))
         return {"tasklist_id": tasklist_id, "task": task}
     except HttpError as e:
-        logger.error(f"Google Tasks API error: {e}")
-        return {"error": f"Google Tasks API error: {str(e)}"}
+        return _err(_handle_http_error(e, tasklist_id))
     except Exception as e:
-        logger.error(f"Error fetching task: {e}")
-        return {"error": str(e)}
+        return _err(f"Error fetching task: {e}")
 
 
 @mcp.tool
@@ -618,9 +989,9 @@ async def search_tasks(
     """
     Search and filter tasks using various criteria.
     
-    This function retrieves tasks from the API and applies client-side filtering
-    based on the provided criteria. You can search by text, filter by completion
-    status, and filter by due date ranges.
+    Completion status and due date ranges are filtered by the API; the text
+    query is matched client-side, paging through the list until enough tasks
+    match. Tasks without a due date are excluded when a due date bound is given.
     
     Args:
         ctx: FastMCP context
@@ -628,49 +999,66 @@ async def search_tasks(
         query: Text to search for in task titles and notes (case-insensitive)
         include_completed: Whether to include completed tasks (default: False)
         include_deleted: Whether to include deleted tasks (default: False)
-        due_before: Only return tasks due before this date (RFC 3339 format)
-        due_after: Only return tasks due after this date (RFC 3339 format)
-        max_results: Maximum number of tasks to retrieve before filtering (default: 100)
+        due_before: Only return tasks due before this date (YYYY-MM-DD or RFC 3339 format)
+        due_after: Only return tasks due after this date (YYYY-MM-DD or RFC 3339 format)
+        max_results: Maximum number of matching tasks to return (default: 100)
     
     Returns:
         Dictionary with 'tasklist_id', 'total' (count of matching tasks), and 'tasks' array
     """
+    # Parse the bounds once, before any API call, so bad input fails fast
+    try:
+        due_max = _to_rfc3339(due_before) if due_before else None
+        due_min = _to_rfc3339(due_after) if due_after else None
+    except ValueError as e:
+        return _err(f"Invalid due date bound. Use YYYY-MM-DD or RFC 3339 format. Error: {str(e)}")
+
     try:
-        service = get_google_tasks_service()
+        service = await _get_service()
         if not service:
-            return {"error": "Auth failed"}
-        resolved = _resolve_tasklist_id(service, tasklist_id)
+            return _err("Auth failed")
+        resolved = await _resolve_tasklist_id(service, tasklist_id)
         if "error" in resolved:
-            return {"error": resolved["error"], **resolved}
+            return resolved
         tasklist_id = resolved["tasklist_id"]
 
         params: Dict[str, Any] = {
             "tasklist": tasklist_id,
-            "maxResults": max_results,
+            # A text query may reject most of a page, so fetch full pages
+            "maxResults": _MAX_PAGE_SIZE if query else min(max_results, _MAX_PAGE_SIZE),
             "showCompleted": include_completed,
             "showDeleted": include_deleted,
+            "fields": _SEARCH_MASK,
         }
-        items = service.tasks().list(**params).execute().get("items", [])
-
-        def _match(t: Dict[str, Any]) -> bool:
-            if query:
-                text = (t.get("title", "") + " " + t.get("notes", "")).lower()
-                if query.lower() not in text:
-                    return False
-            if due_before and t.get("due") and t["due"] > due_before:
-                return False
-            if due_after and t.get("due") and t["due"] < due_after:
-                return False
-            return True
+        # Due date bounds are applied server-side
+        if due_max:
+            params["dueMax"] = due_max
+        if due_min:
+            params["dueMin"] = due_min
 
-        filtered = [t for t in items if _match(t)]
+        q_lower = query.lower() if query else None
+
+        filtered: List[Dict[str, Any]] = []
+        while True:
+            page = await _run(service.tasks().list(**params))
+            items = page.get("items", [])
+            if q_lower is None:
+                filtered.extend(items)
+            else:
+                for t in items:
+                    # Check the title first; notes are only lowercased on a miss
+                    if q_lower in t.get("title", "").lower() or q_lower in t.get("notes", "").lower():
+                        filtered.append(t)
+            page_token = page.get("nextPageToken")
+            if not page_token or len(filtered) >= max_results:
+                break
+            params["pageToken"] = page_token
+        filtered = filtered[:max_results]
         return {"tasklist_id": tasklist_id, "total": len(filtered), "tasks": filtered}
     except HttpError as e:
-        logger.error(f"Google Tasks API error: {e}")
-        return {"error": f"Google Tasks API error: {str(e)}"}
+        return _err(_handle_http_error(e, tasklist_id))
     except Exception as e:
-        logger.error(f"Error searching tasks: {e}")
-        return {"error": str(e)}
+        return _err(f"Error searching tasks: {e}")
 
 
 @mcp.tool
@@ -700,12 +1088,12 @@ async def move_task(
         Dictionary with 'tasklist_id' and 'task' (the moved task object with updated position)
     """
     try:
-        service = get_google_tasks_service()
+        service = await _get_service()
         if not service:
-            return {"error": "Auth failed"}
-        resolved = _resolve_tasklist_id(service, tasklist_id)
+            return _err("Auth failed")
+        resolved = await _resolve_tasklist_id(service, tasklist_id)
         if "error" in resolved:
-            return {"error": resolved["error"], **resolved}
+            return resolved
         tasklist_id = resolved["tasklist_id"]
 
         move_kwargs: Dict[str, Any] = {"tasklist": tasklist_id, "task": task_id}
@@ -713,14 +1101,12 @@ async def move_task(
             move_kwargs["parent"] = parent
         if previous is not None:
             move_kwargs["previous"] = previous
-        moved = service.tasks().move(**move_kwargs).execute()
+        moved = await _run(service.tasks().move(**move_kwargs))
         return {"tasklist_id": tasklist_id, "task": moved}
     except HttpError as e:
-        logger.error(f"Google Tasks API error: {e}")
-        return {"error": f"Google Tasks API error: {str(e)}"}
+        return _err(_handle_http_error(e, tasklist_id))
     except Exception as e:
-        logger.error(f"Error moving task: {e}")
-        return {"error": str(e)}
+        return _err(f"Error moving task: {e}")
 
 def main():
     """Main entry point for the MCP server."""
@@ -14,63 +14,93 @@ from typing import Dict, Any
 from server import get_google_tasks_service
 
 
+async def _run(request) -> Any:
+    """Execute a request in a worker thread so independent calls can overlap."""
+    return await asyncio.to_thread(request.execute)
+
+
+async def _run_batch(svc, *requests) -> None:
+    """Send several requests in one batch HTTP call, raising the first error."""
+    errors = []
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            errors.append(exception)
+
+    batch = svc.new_batch_http_request(callback=_collect)
+    for request in requests:
+        batch.add(request)
+    await asyncio.to_thread(batch.execute)
+    if errors:
+        raise errors[0]
+
+
 async def main() -> None:
     print("🚀 Running integration test for MCP tools")
+    # Build the service once, before timing starts, and reuse it throughout
     svc = get_google_tasks_service()
     if not svc:
         print("❌ Auth failed - ensure credentials.json/token.json are present")
         return
+    start = time.perf_counter()
 
     # 1) Create tasklist
     title = f"MCP Test List {int(time.time())}"
-    tl = svc.tasklists().insert(body={"title": title}).execute()
+    tl = await _run(svc.tasklists().insert(body={"title": title}))
     tasklist_id = tl["id"]
     print(f"✅ Created tasklist: {tasklist_id} -> {title}")
 
     try:
         # 2) Create task (root)
-        t1 = svc.tasks().insert(tasklist=tasklist_id, body={
+        t1 = await _run(svc.tasks().insert(tasklist=tasklist_id, body={
             "title": "Test Task 1",
             "notes": "Created by integration test"
-        }).execute()
+        }))
         print(f"✅ Created task: {t1['id']}")
 
-        # 3) Get task
-        got = svc.tasks().get(tasklist=tasklist_id, task=t1["id"]).execute()
+        # 3) Get task, creating the second task (used in step 6) concurrently
+        got, t2 = await asyncio.gather(
+            _run(svc.tasks().get(tasklist=tasklist_id, task=t1["id"])),
+            _run(svc.tasks().insert(tasklist=tasklist_id, body={"title": "Test Task 2"})),
+        )
         print(f"✅ Got task title: {got.get('title')}")
+        print(f"✅ Created task: {t2['id']}")
 
         # 4) Update task
-        upd = svc.tasks().patch(tasklist=tasklist_id, task=t1["id"], body={
+        upd = await _run(svc.tasks().patch(tasklist=tasklist_id, task=t1["id"], body={
             "notes": "Updated notes",
             "title": "Test Task 1 (updated)"
-        }).execute()
+        }))
         print(f"✅ Updated task title: {upd.get('title')}")
 
         # 5) Complete task
-        done = svc.tasks().patch(tasklist=tasklist_id, task=t1["id"], body={
+        done = await _run(svc.tasks().patch(tasklist=tasklist_id, task=t1["id"], body={
             "status": "completed"
-        }).execute()
+        }))
         print(f"✅ Completed task status: {done.get('status')}")
 
-        # 6) Create another task then move first after it
-        t2 = svc.tasks().insert(tasklist=tasklist_id, body={"title": "Test Task 2"}).execute()
-        moved = svc.tasks().move(tasklist=tasklist_id, task=t1["id"], previous=t2["id"]).execute()
+        # 6) Move first task after the second
+        moved = await _run(svc.tasks().move(tasklist=tasklist_id, task=t1["id"], previous=t2["id"]))
         print(f"✅ Moved task position: {moved.get('position')}")
 
         # 7) Search (client-side) - list and filter
-        items = svc.tasks().list(tasklist=tasklist_id, showCompleted=True).execute().get("items", [])
+        items = (await _run(svc.tasks().list(tasklist=tasklist_id, showCompleted=True))).get("items", [])
         filtered = [i for i in items if "updated" in i]
         print(f"✅ Search-like filter count: {len(filtered)}")
 
-        # 8) Delete tasks
-        svc.tasks().delete(tasklist=tasklist_id, task=t1["id"]).execute()
-        svc.tasks().delete(tasklist=tasklist_id, task=t2["id"]).execute()
+        # 8) Delete tasks in a single batch request
+        await _run_batch(
+            svc,
+            svc.tasks().delete(tasklist=tasklist_id, task=t1["id"]),
+            svc.tasks().delete(tasklist=tasklist_id, task=t2["id"]),
+        )
         print("✅ Deleted tasks")
 
     finally:
         # Cleanup tasklist
-        svc.tasklists().delete(tasklist=tasklist_id).execute()
+        await _run(svc.tasklists().delete(tasklist=tasklist_id))
         print("✅ Deleted tasklist (cleanup)")
+        print(f"⏱️  Finished in {time.perf_counter() - start:.2f}s")
 
 
 if __name__ == "__main__":
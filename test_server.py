@@ -6,10 +6,110 @@ This script helps verify that the server is working correctly.
 """
 
 import asyncio
+import functools
 import json
 import os
+import sys
+import time
+from typing import Any, Dict
+
 from server import get_google_tasks_service
 
+# Separator line for the suite header and summary
+SEP = "=" * 60
+
+# Fields printed for each task, with their defaults (as get_tasks returns them)
+_TASK_FIELDS = (
+    ("id", None),
+    ("title", ""),
+    ("status", "needsAction"),
+    ("notes", ""),
+    ("due", None),
+    ("updated", None),
+    ("position", None),
+    ("parent", None),
+    ("links", ()),
+)
+
+# Fields printed for each task list: (output key, API key, default)
+_TASKLIST_FIELDS = (
+    ("id", "id", None),
+    ("title", "title", ""),
+    ("updated", "updated", None),
+    ("self_link", "selfLink", None),
+)
+
+# Partial-response masks so the API only sends the printed keys
+_TASKS_LIST_MASK = "items(%s)" % ",".join(k for k, _ in _TASK_FIELDS)
+_TASKLISTS_LIST_MASK = "items(%s)" % ",".join(src for _, src, _ in _TASKLIST_FIELDS)
+
+
+class _RawTask:
+    """Raw API task that is formatted only when the result is serialised."""
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self.raw = raw
+
+
+def _encode_default(o: Any) -> Dict[str, Any]:
+    """Serialise _RawTask objects straight from the API dict, as get_tasks formats them."""
+    if isinstance(o, _RawTask):
+        return {k: o.raw.get(k, d) for k, d in _TASK_FIELDS}
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+# Results are printed as compact JSON; set VERBOSE=1 to pretty-print them
+_VERBOSE = bool(os.environ.get('VERBOSE'))
+
+# Prefer orjson for printing results when it is installed
+try:
+    import orjson
+    _ORJSON_OPTION = orjson.OPT_INDENT_2 if _VERBOSE else None
+
+    def _dumps(obj):
+        return orjson.dumps(obj, default=_encode_default, option=_ORJSON_OPTION).decode()
+except ImportError:
+    _JSON_INDENT = 2 if _VERBOSE else None
+
+    def _dumps(obj):
+        return json.dumps(obj, default=_encode_default, indent=_JSON_INDENT)
+
+
+# Responses are decoded by the service's model (server._FastJsonModel), which
+# already uses orjson when it is installed, so json.loads is left untouched
+async def _run(request):
+    """Execute a request in a worker thread so concurrent tests overlap."""
+    return await asyncio.to_thread(request.execute)
+
+
+# tasklists().list() fetch shared by the get_tasks tests; a task rather than
+# the response so tests running concurrently wait on the same request
+_tasklists_cache = None
+
+
+async def _get_tasklists(service):
+    """Return the task list items (ids only), fetching them only on first use."""
+    global _tasklists_cache
+    if _tasklists_cache is None:
+        _tasklists_cache = asyncio.ensure_future(_run(service.tasklists().list(fields="items(id)")))
+    return (await _tasklists_cache).get('items', [])
+
+
+def _runtest(fn):
+    """Report a test's unexpected error as a failure and print how long it took."""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            print(f"❌ {fn.__name__}: {e}")
+            return False
+        finally:
+            print(f"[{fn.__name__} {1000 * (time.perf_counter() - start):.1f}ms]")
+    return wrapper
+
 
 class MockContext:
     """Mock context for testing."""
@@ -18,223 +118,204 @@ class MockContext:
 
 
 async def test_google_tasks_service():
-    """Test the Google Tasks service authentication."""
+    """Test the Google Tasks service authentication.
+
+    Returns the service for the remaining tests, or None if it is unavailable.
+    """
     print("🔐 Testing Google Tasks Service Authentication...")
     
     # Check if credentials file exists
     if not os.path.exists('credentials.json'):
         print("❌ credentials.json not found. Please download it from Google Cloud Console.")
         print("   See README.md for setup instructions.")
-        return False
+        return None
     
     # Test service creation
     try:
         service = get_google_tasks_service()
         if service:
             print("✅ Google Tasks service created successfully")
-            return True
+            return service
         else:
             print("❌ Failed to create Google Tasks service")
-            return False
+            return None
     except Exception as e:
         print(f"❌ Error creating Google Tasks service: {e}")
-        return False
+        return None
 
 
-async def test_list_tasklists():
+@_runtest
+async def test_list_tasklists(service):
     """Test the list_tasklists functionality directly."""
     print("\n1. Testing list_tasklists...")
-    try:
-        # Test the Google Tasks API directly
-        service = get_google_tasks_service()
-        if not service:
-            print("❌ No Google Tasks service available")
-            return False
-        
-        # Get task lists from Google Tasks API
-        results = service.tasklists().list().execute()
-        tasklists = results.get('items', [])
-        
-        # Format task lists data
-        formatted_lists = []
-        for tasklist in tasklists:
-            formatted_list = {
-                "id": tasklist.get('id'),
-                "title": tasklist.get('title', ''),
-                "updated": tasklist.get('updated'),
-                "self_link": tasklist.get('selfLink')
-            }
-            formatted_lists.append(formatted_list)
-        
-        result = {
-            "total_lists": len(formatted_lists),
-            "tasklists": formatted_lists
-        }
-        
-        print(f"✅ Result: {json.dumps(result, indent=2)}")
-        return True
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
+    # Get task lists from Google Tasks API
+    results = await _run(service.tasklists().list(fields=_TASKLISTS_LIST_MASK))
+    tasklists = results.get('items', [])
+    
+    # Format task lists data the way the list_tasklists tool does
+    formatted_lists = [
+        {key: tasklist.get(src, d) for key, src, d in _TASKLIST_FIELDS} for tasklist in tasklists
+    ]
+    
+    result = {
+        "total_lists": len(formatted_lists),
+        "tasklists": formatted_lists
+    }
+    
+    print(f"✅ Result: {_dumps(result)}")
+    return True
 
 
-async def test_get_tasks():
+@_runtest
+async def test_get_tasks(service):
     """Test the get_tasks functionality directly."""
     print("\n2. Testing get_tasks (default list)...")
-    try:
-        # Test the Google Tasks API directly
-        service = get_google_tasks_service()
-        if not service:
-            print("❌ No Google Tasks service available")
-            return False
-        
-        # Get task lists first to find a valid list
-        tasklists = service.tasklists().list().execute()
-        available_lists = [tl['id'] for tl in tasklists.get('items', [])]
-        
-        if not available_lists:
-            print("❌ No task lists found")
-            return False
-        
-        # Use the first available list
-        tasklist_id = available_lists[0]
-        
-        # Get tasks from Google Tasks API
-        results = service.tasks().list(
-            tasklist=tasklist_id,
-            maxResults=5,
-            showCompleted=False
-        ).execute()
-        tasks = results.get('items', [])
-        
-        # Format tasks data
-        formatted_tasks = []
-        for task in tasks:
-            formatted_task = {
-                "id": task.get('id'),
-                "title": task.get('title', ''),
-                "status": task.get('status', 'needsAction'),
-                "notes": task.get('notes', ''),
-                "due": task.get('due'),
-                "updated": task.get('updated'),
-                "position": task.get('position'),
-                "parent": task.get('parent'),
-                "links": task.get('links', [])
-            }
-            formatted_tasks.append(formatted_task)
-        
-        result = {
-            "tasklist_id": tasklist_id,
-            "max_results": 5,
-            "show_completed": False,
-            "total_tasks": len(formatted_tasks),
-            "tasks": formatted_tasks,
-            "available_lists": available_lists
-        }
-        
-        print(f"✅ Result: {json.dumps(result, indent=2)}")
-        return True
-    except Exception as e:
-        print(f"❌ Error: {e}")
+    # Get task lists first to find a valid list
+    tasklists = await _get_tasklists(service)
+    
+    if not tasklists:
+        print("❌ No task lists found")
         return False
+    
+    # Use the first available list
+    tasklist_id = tasklists[0]['id']
+    
+    # Get tasks from Google Tasks API
+    results = await _run(service.tasks().list(
+        tasklist=tasklist_id,
+        maxResults=5,
+        showCompleted=False,
+        fields=_TASKS_LIST_MASK
+    ))
+    tasks = results.get('items', [])
+    
+    # Tasks are formatted by the encoder, without an intermediate copy
+    formatted_tasks = [_RawTask(task) for task in tasks]
+    
+    result = {
+        "tasklist_id": tasklist_id,
+        "max_results": 5,
+        "show_completed": False,
+        "total_tasks": len(formatted_tasks),
+        "tasks": formatted_tasks,
+    }
+    # The ids are only worth listing when there is a choice of list
+    if len(tasklists) > 1:
+        result["available_lists"] = [tl['id'] for tl in tasklists]
+    
+    print(f"✅ Result: {_dumps(result)}")
+    return True
 
 
-async def test_get_tasks_with_completed():
+@_runtest
+async def test_get_tasks_with_completed(service):
     """Test the get_tasks functionality with completed tasks."""
     print("\n3. Testing get_tasks (with completed tasks)...")
-    try:
-        # Test the Google Tasks API directly
-        service = get_google_tasks_service()
-        if not service:
-            print("❌ No Google Tasks service available")
-            return False
-        
-        # Get task lists first to find a valid list
-        tasklists = service.tasklists().list().execute()
-        available_lists = [tl['id'] for tl in tasklists.get('items', [])]
-        
-        if not available_lists:
-            print("❌ No task lists found")
-            return False
-        
-        # Use the first available list
-        tasklist_id = available_lists[0]
-        
-        # Get tasks from Google Tasks API (including completed)
-        results = service.tasks().list(
-            tasklist=tasklist_id,
-            maxResults=10,
-            showCompleted=True
-        ).execute()
-        tasks = results.get('items', [])
-        
-        # Format tasks data
-        formatted_tasks = []
-        for task in tasks:
-            formatted_task = {
-                "id": task.get('id'),
-                "title": task.get('title', ''),
-                "status": task.get('status', 'needsAction'),
-                "notes": task.get('notes', ''),
-                "due": task.get('due'),
-                "updated": task.get('updated'),
-                "position": task.get('position'),
-                "parent": task.get('parent'),
-                "links": task.get('links', [])
-            }
-            formatted_tasks.append(formatted_task)
-        
-        result = {
-            "tasklist_id": tasklist_id,
-            "max_results": 10,
-            "show_completed": True,
-            "total_tasks": len(formatted_tasks),
-            "tasks": formatted_tasks,
-            "available_lists": available_lists
-        }
-        
-        print(f"✅ Result: {json.dumps(result, indent=2)}")
-        return True
-    except Exception as e:
-        print(f"❌ Error: {e}")
+    # Get task lists first to find a valid list
+    tasklists = await _get_tasklists(service)
+    
+    if not tasklists:
+        print("❌ No task lists found")
         return False
+    
+    # Use the first available list
+    tasklist_id = tasklists[0]['id']
+    
+    # Get tasks from Google Tasks API (including completed)
+    results = await _run(service.tasks().list(
+        tasklist=tasklist_id,
+        maxResults=10,
+        showCompleted=True,
+        fields=_TASKS_LIST_MASK
+    ))
+    tasks = results.get('items', [])
+    
+    # Tasks are formatted by the encoder, without an intermediate copy
+    formatted_tasks = [_RawTask(task) for task in tasks]
+    
+    result = {
+        "tasklist_id": tasklist_id,
+        "max_results": 10,
+        "show_completed": True,
+        "total_tasks": len(formatted_tasks),
+        "tasks": formatted_tasks,
+    }
+    # The ids are only worth listing when there is a choice of list
+    if len(tasklists) > 1:
+        result["available_lists"] = [tl['id'] for tl in tasklists]
+    
+    print(f"✅ Result: {_dumps(result)}")
+    return True
+
+
+def _print_next_steps():
+    """Print the summary for a passing run."""
+    lines = [
+        "\n📋 Test Summary:",
+        SEP,
+        "✅ Authentication setup is correct",
+        "✅ Server functions are working",
+        "\n🎉 All tests passed! Your server is ready to use.",
+        "\nNext steps:",
+        "1. Run: python main.py",
+        "2. The server will open a browser for Google authentication",
+        "3. Grant permissions to access your Google Tasks",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-async def test_server():
-    """Main test function."""
+def _print_fix_instructions():
+    """Print the summary for a run that failed authentication."""
+    lines = [
+        "\n📋 Test Summary:",
+        SEP,
+        "❌ Authentication setup needs attention",
+        "\nTo fix:",
+        "1. Go to Google Cloud Console",
+        "2. Enable Google Tasks API",
+        "3. Create OAuth 2.0 credentials",
+        "4. Download credentials.json to project root",
+        "5. Run this test again",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _print_test_failures(failed):
+    """Print the summary for a run where some server function tests failed."""
+    lines = [
+        "\n📋 Test Summary:",
+        SEP,
+        "✅ Authentication setup is correct",
+        f"❌ {len(failed)} server function test(s) failed: {', '.join(failed)}",
+        "\nSee the errors above for details.",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def test_server() -> bool:
+    """Main test function; returns True only if every test passed."""
     print("🚀 Google Tasks MCP Server Test Suite")
-    print("=" * 60)
-    
-    # Test 1: Check authentication setup
-    auth_ok = await test_google_tasks_service()
-    
-    # Test 2: Test server functions
-    if auth_ok:
-        await test_list_tasklists()
-        await test_get_tasks()
-        await test_get_tasks_with_completed()
-    
-    # Summary
-    print("\n📋 Test Summary:")
-    print("=" * 60)
-    
-    if auth_ok:
-        print("✅ Authentication setup is correct")
-        print("✅ Server functions are working")
-        print("\n🎉 All tests passed! Your server is ready to use.")
-        print("\nNext steps:")
-        print("1. Run: python main.py")
-        print("2. The server will open a browser for Google authentication")
-        print("3. Grant permissions to access your Google Tasks")
-    else:
-        print("❌ Authentication setup needs attention")
-        print("\nTo fix:")
-        print("1. Go to Google Cloud Console")
-        print("2. Enable Google Tasks API")
-        print("3. Create OAuth 2.0 credentials")
-        print("4. Download credentials.json to project root")
-        print("5. Run this test again")
+    print(SEP)
+    
+    # Test 1: Check authentication setup; nothing else can run without it
+    service = await test_google_tasks_service()
+    if service is None:
+        _print_fix_instructions()
+        return False
+    
+    # Test 2: Test server functions; they only read, so run them concurrently
+    tests = (test_list_tasklists, test_get_tasks, test_get_tasks_with_completed)
+    results = await asyncio.gather(
+        *(test(service) for test in tests),
+        return_exceptions=True,
+    )
+    failed = [test.__name__ for test, result in zip(tests, results) if result is not True]
+    if failed:
+        _print_test_failures(failed)
+        return False
+    _print_next_steps()
+    return True
 
 
 if __name__ == "__main__":
-    asyncio.run(test_server())
+    sys.exit(0 if asyncio.run(test_server()) else 1)